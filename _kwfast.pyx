@@ -0,0 +1,57 @@
+# cython: language_level=3
+"""
+Compiled keyword selection for Music Collection Processor.
+
+Optional drop-in for the pure-Python _combine_keywords_py in
+music_collection_processor.py, which is used automatically when this
+extension is importable. Build it in place with:
+
+    pip3 install cython
+    cythonize -i _kwfast.pyx
+
+Keep the logic in step with the Python version; both must return
+identical keywords.
+"""
+
+# Artist words marking a compilation, whose artist is left out of the keywords
+cdef frozenset _VA_SET = frozenset(("various", "va", "compilation"))
+
+
+cdef list _unique_words(str text, frozenset stopwords):
+    """Split text into words, dropping stopwords, single characters and repeats."""
+    cdef list words = []
+    cdef set seen = set()
+    cdef str word
+
+    for word in text.split():
+        if len(word) > 1 and word not in stopwords and word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+cpdef str combine_keywords(str artist_clean, str title_clean, int max_words,
+                           frozenset stopwords):
+    """Pure keyword selection shared by every CollectionProcessor."""
+    cdef list artist_words = _unique_words(artist_clean, stopwords)
+    cdef list title_words = _unique_words(title_clean, stopwords)
+    cdef list combined_words = []
+    cdef str word
+
+    # Handle "Various Artists" case
+    if not _VA_SET.isdisjoint(artist_words):
+        artist_words = []
+
+    # Add up to 2 artist words first
+    for word in artist_words[:2]:
+        if len(combined_words) < max_words:
+            combined_words.append(word)
+
+    # Fill remaining slots with title words
+    for word in title_words:
+        if len(combined_words) >= max_words:
+            break
+        if word not in combined_words:
+            combined_words.append(word)
+
+    return ' '.join(combined_words)
@@ -4,11 +4,18 @@ Example usage script for Music Collection Processor
 Creates sample data and demonstrates various processing options
 """
 
-import pandas as pd
+import csv
 import os
 import subprocess
 import sys
 
+def write_sample_csv(path, rows):
+    """Write a list of row dicts to a CSV file."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+
 def create_sample_data():
     """Create sample music collection data for testing."""
     sample_data = [
@@ -29,8 +36,7 @@ def create_sample_data():
         {"Artist": "The Velvet Underground", "Title": "The Velvet Underground & Nico", "Year": "1967"}
     ]
     
-    df = pd.DataFrame(sample_data)
-    df.to_csv("sample_collection.csv", index=False)
+    write_sample_csv("sample_collection.csv", sample_data)
     print("✅ Created sample_collection.csv with 15 albums")
     return "sample_collection.csv"
 
@@ -123,7 +129,7 @@ def demonstrate_formats():
         {"Artist": "The Beatles", "Title": "Abbey Road", "Label": "Apple Records", "Format": "Vinyl"},
         {"Artist": "Pink Floyd", "Title": "Dark Side of the Moon", "Label": "Harvest", "Format": "CD"}
     ]
-    pd.DataFrame(discogs_data).to_csv("sample_discogs.csv", index=False)
+    write_sample_csv("sample_discogs.csv", discogs_data)
     print("✅ Created sample_discogs.csv (Discogs format)")
     
     # Last.fm format  
@@ -131,7 +137,7 @@ def demonstrate_formats():
         {"artist": "radiohead", "album": "ok computer", "playcount": "156"},
         {"artist": "the beatles", "album": "revolver", "playcount": "89"}
     ]
-    pd.DataFrame(lastfm_data).to_csv("sample_lastfm.csv", index=False)
+    write_sample_csv("sample_lastfm.csv", lastfm_data)
     print("✅ Created sample_lastfm.csv (Last.fm format)")
     
     # Custom format
@@ -139,7 +145,7 @@ def demonstrate_formats():
         {"Band Name": "Led Zeppelin", "Album Title": "Physical Graffiti", "Rating": "5/5"},
         {"Band Name": "Queen", "Album Title": "Bohemian Rhapsody", "Rating": "4/5"}
     ]
-    pd.DataFrame(custom_data).to_csv("sample_custom.csv", index=False)
+    write_sample_csv("sample_custom.csv", custom_data)
     print("✅ Created sample_custom.csv (Custom format)")
     
     print("\nTo process these different formats:")
@@ -10,13 +10,15 @@ Supports multiple export formats (Discogs, Last.fm, etc.) and search engines.
 import pandas as pd
 import re
 import argparse
+import functools
 import os
 import sys
 import json
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple
 import logging
 
 # ========================
@@ -49,6 +51,17 @@ DEFAULT_CONFIG = {
     ]
 }
 
+# Collections at least this large generate keywords across worker processes
+PARALLEL_THRESHOLD = 100_000
+
+# Artist words marking a compilation, whose artist is left out of the keywords
+_VA_SET = frozenset(("various", "va", "compilation"))
+
+# Text cleaning patterns, compiled once and shared by every row
+_PAREN_RE = re.compile(r'[\(\[\{].*?[\)\]\}]')
+_SPECIAL_RE = re.compile(r'[^\w\s\-]')
+_WS_RE = re.compile(r'\s+')
+
 # ========================
 # Logging Setup
 # ========================
@@ -82,11 +95,64 @@ def setup_logging(silent: bool = False, log_file: str = "collection_processor.lo
 # Core Processing Functions
 # ========================
 
+def _combine_keywords_py(artist_clean: str, title_clean: str, max_words: int,
+                         stopwords: FrozenSet[str]) -> str:
+    """Pure keyword selection shared by every CollectionProcessor."""
+    # Split into words and remove stopwords/duplicates while preserving order;
+    # dict.fromkeys dedupes in O(1) per word where list membership was O(k)
+    artist_words = list(dict.fromkeys(
+        word for word in artist_clean.split() if len(word) > 1 and word not in stopwords
+    ))
+    title_words = list(dict.fromkeys(
+        word for word in title_clean.split() if len(word) > 1 and word not in stopwords
+    ))
+    
+    # Handle "Various Artists" case
+    if not _VA_SET.isdisjoint(artist_words):
+        artist_words = []
+    
+    # Combine artist and title words, prioritizing artist
+    combined_words = []
+    
+    # Add up to 2 artist words first
+    for word in artist_words[:2]:
+        if len(combined_words) < max_words:
+            combined_words.append(word)
+    
+    # Fill remaining slots with title words
+    for word in title_words:
+        if len(combined_words) >= max_words:
+            break
+        if word not in combined_words:
+            combined_words.append(word)
+    
+    return ' '.join(combined_words)
+
+# Prefer the compiled keyword selector when it has been built (see _kwfast.pyx)
+try:
+    from _kwfast import combine_keywords as _combine_keywords_impl
+except ImportError:
+    _combine_keywords_impl = _combine_keywords_py
+
+# Memoized per unique (artist, title) pair; collections repeat artists and
+# frequently contain duplicate releases.
+_combine_keywords_cached = functools.lru_cache(maxsize=1 << 16)(_combine_keywords_impl)
+
+@functools.lru_cache(maxsize=1 << 16)
+def _quote_query(keywords: str) -> str:
+    """URL-quote keywords for use as a search query."""
+    return urllib.parse.quote_plus(keywords)
+
 class CollectionProcessor:
     def __init__(self, config: Dict = None, logger: logging.Logger = None):
         self.config = config or DEFAULT_CONFIG
         self.logger = logger or logging.getLogger("collection_processor")
-        self.stopwords = set(word.lower() for word in self.config["stopwords"])
+        self.stopwords = frozenset(word.lower() for word in self.config["stopwords"])
+        # URL templates split around {query} once, so a link is joined rather than formatted
+        self._engine_parts = {
+            engine: tuple(url_template.split('{query}'))
+            for engine, url_template in self.config["search_engines"].items()
+        }
     
     def detect_columns(self, df: pd.DataFrame) -> Tuple[Optional[str], Optional[str]]:
         """Auto-detect artist and title columns."""
@@ -116,54 +182,49 @@ class CollectionProcessor:
         text = str(text).lower()
         
         # Remove parentheses and brackets content
-        text = re.sub(r'[\(\[\{].*?[\)\]\}]', '', text)
+        text = _PAREN_RE.sub('', text)
         
         # Remove special characters except spaces and hyphens
-        text = re.sub(r'[^\w\s\-]', ' ', text)
+        text = _SPECIAL_RE.sub(' ', text)
         
         # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         return text
     
+    def clean_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized equivalent of clean_text for a whole column."""
+        values = series.astype(object).fillna('')
+        # Falsy values (0, 0.0, False) clean to '' just like clean_text's `not text`
+        values = values.where(values.astype(bool), '')
+        # Build the text straight into an object column: Series.map(str) is inferred
+        # as the Arrow-backed str dtype on pandas 3, whose .str.lower() differs from
+        # Python's str.lower for some characters
+        text = pd.Series([str(value) for value in values], index=series.index, dtype=object)
+        return (text
+                .str.lower()
+                .str.replace(_PAREN_RE, '', regex=True)
+                .str.replace(_SPECIAL_RE, ' ', regex=True)
+                .str.replace(_WS_RE, ' ', regex=True)
+                .str.strip())
+    
     def generate_keywords(self, artist: str, title: str, max_words: int = None) -> str:
         """Generate search-friendly keywords from artist and title."""
+        return self.combine_keywords(self.clean_text(artist), self.clean_text(title), max_words)
+    
+    def combine_keywords(self, artist_clean: str, title_clean: str, max_words: int = None) -> str:
+        """Build keywords from artist and title text already passed through clean_text."""
         max_words = max_words or self.config["max_keywords"]
-        
-        artist_clean = self.clean_text(artist)
-        title_clean = self.clean_text(title)
-        
-        # Split into words and remove stopwords/duplicates while preserving order
-        artist_words = []
-        for word in artist_clean.split():
-            if word not in self.stopwords and word not in artist_words and len(word) > 1:
-                artist_words.append(word)
-        
-        title_words = []
-        for word in title_clean.split():
-            if word not in self.stopwords and word not in title_words and len(word) > 1:
-                title_words.append(word)
-        
-        # Handle "Various Artists" case
-        if any(word in ["various", "va", "compilation"] for word in artist_words):
-            artist_words = []
-        
-        # Combine artist and title words, prioritizing artist
-        combined_words = []
-        
-        # Add up to 2 artist words first
-        for word in artist_words[:2]:
-            if len(combined_words) < max_words:
-                combined_words.append(word)
-        
-        # Fill remaining slots with title words
-        for word in title_words:
-            if len(combined_words) >= max_words:
-                break
-            if word not in combined_words:
-                combined_words.append(word)
-        
-        return ' '.join(combined_words)
+        return _combine_keywords_cached(artist_clean, title_clean, max_words, self.stopwords)
+    
+    def generate_keywords_parallel(self, artists: List[str], titles: List[str],
+                                   workers: int = None) -> List[str]:
+        """Generate keywords for many artist/title pairs across worker processes."""
+        workers = workers or _available_cpus()
+        self.logger.info(f"Using {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_keyword_worker,
+                                 initargs=(self.config,)) as executor:
+            return list(executor.map(_keyword_worker, zip(artists, titles), chunksize=1000))
     
     def generate_search_links(self, keywords: str, search_engines: List[str] = None) -> Dict[str, str]:
         """Generate search links for specified search engines."""
@@ -171,12 +232,10 @@ class CollectionProcessor:
             search_engines = [self.config["default_search_engine"]]
         
         links = {}
-        query = urllib.parse.quote_plus(keywords)
         
         for engine in search_engines:
-            if engine in self.config["search_engines"]:
-                url_template = self.config["search_engines"][engine]
-                links[engine] = url_template.format(query=query)
+            if engine in self._engine_parts:
+                links[engine] = _quote_query(keywords).join(self._engine_parts[engine])
             else:
                 self.logger.warning(f"Unknown search engine: {engine}")
         
@@ -204,10 +263,13 @@ class CollectionProcessor:
         
         # Generate keywords
         self.logger.info("Generating keywords...")
-        df['Keywords'] = df.apply(
-            lambda row: self.generate_keywords(row[artist_col], row[title_col]), 
-            axis=1
-        )
+        if len(df) >= PARALLEL_THRESHOLD and _available_cpus() > 1:
+            keywords = self.generate_keywords_parallel(df[artist_col].tolist(), df[title_col].tolist())
+        else:
+            artists = self.clean_series(df[artist_col]).tolist()
+            titles = self.clean_series(df[title_col]).tolist()
+            keywords = [self.combine_keywords(artist, title) for artist, title in zip(artists, titles)]
+        df['Keywords'] = keywords
         
         # Generate search links
         if not search_engines:
@@ -215,10 +277,21 @@ class CollectionProcessor:
         
         self.logger.info(f"Generating search links for: {', '.join(search_engines)}")
         
+        # Quote each keyword string once and reuse it for every engine
+        quoted = df['Keywords'].astype(str).map(urllib.parse.quote_plus)
+        
         for engine in search_engines:
-            df[f'{engine.title()}_Link'] = df['Keywords'].apply(
-                lambda kw: self.generate_search_links(kw, [engine]).get(engine, '')
-            )
+            template_parts = self._engine_parts.get(engine)
+            if template_parts is None:
+                self.logger.warning(f"Unknown search engine: {engine}")
+                df[f'{engine.title()}_Link'] = ''
+                continue
+            
+            # Whole-column concatenation: prefix + quoted + suffix for the usual template
+            links = template_parts[0]
+            for part in template_parts[1:]:
+                links = links + quoted + part
+            df[f'{engine.title()}_Link'] = links
         
         # Add a combined search link column for the primary engine
         primary_engine = search_engines[0]
@@ -226,135 +299,123 @@ class CollectionProcessor:
         
         return df
 
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on, honouring affinity where supported."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+# Worker-process state for generate_keywords_parallel
+_WORKER_PROCESSOR = None
+
+def _init_keyword_worker(config: Dict):
+    """Build the CollectionProcessor each worker process reuses."""
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = CollectionProcessor(config)
+
+def _keyword_worker(pair: Tuple[str, str]) -> str:
+    """Generate keywords for one (artist, title) pair inside a worker process."""
+    return _WORKER_PROCESSOR.generate_keywords(*pair)
+
 # ========================
 # HTML Generation
 # ========================
 
-def generate_html_report(df: pd.DataFrame, output_path: str, items_per_page: int = 100, 
-                        config: Dict = None, logger: logging.Logger = None):
-    """Generate a paginated HTML report."""
-    config = config or DEFAULT_CONFIG
-    logger = logger or logging.getLogger("collection_processor")
-    
-    total_items = len(df)
-    total_pages = (total_items + items_per_page - 1) // items_per_page
-    
-    # Create output directory
-    output_dir = Path(output_path).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    base_name = Path(output_path).stem
-    
-    for page in range(total_pages):
-        start_idx = page * items_per_page
-        end_idx = min(start_idx + items_per_page, total_items)
-        page_df = df.iloc[start_idx:end_idx]
-        
-        # Generate filename
-        if total_pages == 1:
-            filename = f"{base_name}.html"
-        else:
-            filename = f"{base_name}_page_{page + 1}.html"
-        
-        filepath = output_dir / filename
-        
-        # Generate HTML content
-        html_content = generate_page_html(page_df, page + 1, total_pages, config)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"Generated HTML page: {filepath}")
+# Single-pass escaping for text and attribute values placed in the report
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
 
-def generate_page_html(df: pd.DataFrame, page_num: int, total_pages: int, config: Dict) -> str:
-    """Generate HTML content for a single page."""
-    
-    # Detect key columns
-    artist_col, title_col = None, None
-    for col in config["artist_columns"]:
-        if col in df.columns:
-            artist_col = col
-            break
-    for col in config["title_columns"]:
-        if col in df.columns:
-            title_col = col
-            break
-    
-    html = f"""<!DOCTYPE html>
+# Album card fragments, filled in once per row
+_CARD_OPEN_HTML = """
+        <div class="album-card">
+            <div class="artist">{artist}</div>
+            <div class="title">{title}</div>
+            <div class="keywords">Keywords: {keywords}</div>
+            <div class="links">
+"""
+_LINK_BUTTON_HEAD_HTML = '<a href="'
+_LINK_BUTTON_TAIL_HTML = '" target="_blank" class="link-btn">{engine}</a>'
+_CARD_CLOSE_HTML = """
+            </div>
+        </div>
+"""
+
+# Static page head shared by every report page; only the title's page number
+# is filled in, with %-formatting so the stylesheet needs no brace escaping
+_PAGE_HEAD_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Music Collection - Page {page_num}</title>
+    <title>Music Collection - Page %d</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 30px;
             border-radius: 10px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #333;
             text-align: center;
             margin-bottom: 30px;
             border-bottom: 3px solid #007bff;
             padding-bottom: 10px;
-        }}
-        .pagination {{
+        }
+        .pagination {
             text-align: center;
             margin: 20px 0;
             font-size: 16px;
             color: #666;
-        }}
-        .album-grid {{
+        }
+        .album-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
             gap: 20px;
             margin: 30px 0;
-        }}
-        .album-card {{
+        }
+        .album-card {
             border: 1px solid #ddd;
             border-radius: 8px;
             padding: 20px;
             background: #fff;
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        .album-card:hover {{
+        }
+        .album-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
-        .artist {{
+        }
+        .artist {
             font-weight: bold;
             font-size: 16px;
             color: #007bff;
             margin-bottom: 5px;
-        }}
-        .title {{
+        }
+        .title {
             font-size: 14px;
             color: #333;
             margin-bottom: 10px;
-        }}
-        .keywords {{
+        }
+        .keywords {
             font-size: 12px;
             color: #666;
             font-style: italic;
             margin-bottom: 15px;
-        }}
-        .links {{
+        }
+        .links {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
-        }}
-        .link-btn {{
+        }
+        .link-btn {
             padding: 6px 12px;
             background: #007bff;
             color: white;
@@ -362,86 +423,183 @@ def generate_page_html(df: pd.DataFrame, page_num: int, total_pages: int, config
             border-radius: 4px;
             font-size: 12px;
             transition: background 0.2s;
-        }}
-        .link-btn:hover {{
+        }
+        .link-btn:hover {
             background: #0056b3;
-        }}
-        .stats {{
+        }
+        .stats {
             text-align: center;
             background: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             margin-bottom: 20px;
-        }}
-        @media (max-width: 768px) {{
-            .album-grid {{
+        }
+        @media (max-width: 768px) {
+            .album-grid {
                 grid-template-columns: 1fr;
-            }}
-            .container {{
+            }
+            .container {
                 padding: 15px;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>🎵 Music Collection</h1>
         
-        <div class="stats">
-            <strong>Page {page_num} of {total_pages}</strong> • 
-            Showing {len(df)} items • 
-            Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        </div>
 """
 
-    if total_pages > 1:
-        html += f"""
-        <div class="pagination">
-            Navigation: 
-"""
-        for p in range(1, total_pages + 1):
-            if p == page_num:
-                html += f"<strong>{p}</strong> "
-            else:
-                page_file = f"_page_{p}.html" if total_pages > 1 else ".html"
-                html += f'<a href="{Path(output_path).stem}{page_file}">{p}</a> '
-        html += "</div>"
+def build_nav_links(output_path: str, total_pages: int) -> Optional[List[Tuple[int, str]]]:
+    """Build the (page number, anchor HTML) pairs for a report's navigation bar."""
+    if total_pages <= 1:
+        return None
+    base_name = Path(output_path).stem
+    return [
+        (p, f'<a href="{urllib.parse.quote(f"{base_name}_page_{p}.html")}">{p}</a> ')
+        for p in range(1, total_pages + 1)
+    ]
 
-    html += '<div class="album-grid">'
+def generate_html_report(df: pd.DataFrame, output_path: str, items_per_page: int = 100, 
+                        config: Dict = None, logger: logging.Logger = None,
+                        page_offset: int = 0, total_items: int = None,
+                        nav_links: List[Tuple[int, str]] = None):
+    """Generate a paginated HTML report.
+    
+    When writing a large collection slice by slice, df holds one slice,
+    page_offset is the number of pages already written and total_items is
+    the size of the whole collection. Such callers can pass nav_links from
+    build_nav_links so it is built once for the whole report.
+    """
+    config = config or DEFAULT_CONFIG
+    logger = logger or logging.getLogger("collection_processor")
+    
+    slice_items = len(df)
+    total_items = slice_items if total_items is None else total_items
+    total_pages = (total_items + items_per_page - 1) // items_per_page
+    slice_pages = (slice_items + items_per_page - 1) // items_per_page
+    
+    # Create output directory
+    output_dir = Path(output_path).parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    base_name = Path(output_path).stem
+    
+    # Navigation anchors are the same on every page, so build them once
+    if nav_links is None:
+        nav_links = build_nav_links(output_path, total_pages)
     
-    for _, row in df.iterrows():
-        artist = row.get(artist_col, 'Unknown Artist') if artist_col else 'Unknown Artist'
-        title = row.get(title_col, 'Unknown Title') if title_col else 'Unknown Title'
-        keywords = row.get('Keywords', '')
+    for page in range(slice_pages):
+        start_idx = page * items_per_page
+        end_idx = min(start_idx + items_per_page, slice_items)
+        page_df = df.iloc[start_idx:end_idx]
+        page_num = page_offset + page + 1
         
-        html += f"""
-        <div class="album-card">
-            <div class="artist">{artist}</div>
-            <div class="title">{title}</div>
-            <div class="keywords">Keywords: {keywords}</div>
-            <div class="links">
-"""
+        # Generate filename
+        if total_pages == 1:
+            filename = f"{base_name}.html"
+        else:
+            filename = f"{base_name}_page_{page_num}.html"
+        
+        filepath = output_dir / filename
+        
+        # Stream HTML content straight to disk through a large write buffer
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            generate_page_html(page_df, page_num, total_pages, config, f, nav_links)
+        
+        logger.info(f"Generated HTML page: {filepath}")
+
+def _column_values(df: pd.DataFrame, col: str) -> List:
+    """Column values as a list, with every kind of missing value as NaN.
+    
+    Arrow-backed columns hold pd.NA where the C parser gives NaN; normalizing
+    keeps the report the same whichever engine read the file.
+    """
+    values = df[col].astype(object)
+    return values.where(values.notna(), float('nan')).tolist()
+
+def _render_album_cards(artists: List, titles: List, keywords_list: List,
+                        link_rows: Iterable[Tuple], button_tails: List[str]) -> Iterator[str]:
+    """Yield the escaped HTML for each album card in turn."""
+    for artist, title, keywords, links in zip(artists, titles, keywords_list, link_rows):
+        card = [_CARD_OPEN_HTML.format(
+            artist=str(artist).translate(_HTML_ESCAPE),
+            title=str(title).translate(_HTML_ESCAPE),
+            keywords=str(keywords).translate(_HTML_ESCAPE),
+        )]
         
         # Add search links
-        link_columns = [col for col in df.columns if col.endswith('_Link')]
-        for link_col in link_columns:
-            if pd.notna(row[link_col]) and row[link_col]:
-                engine_name = link_col.replace('_Link', '')
-                html += f'<a href="{row[link_col]}" target="_blank" class="link-btn">{engine_name}</a>'
+        for button_tail, link in zip(button_tails, links):
+            if isinstance(link, str) and link:
+                card.append(_LINK_BUTTON_HEAD_HTML + link.translate(_HTML_ESCAPE) + button_tail)
         
-        html += """
-            </div>
+        card.append(_CARD_CLOSE_HTML)
+        yield "".join(card)
+
+def generate_page_html(df: pd.DataFrame, page_num: int, total_pages: int, config: Dict,
+                       out: TextIO, nav_links: List[Tuple[int, str]] = None):
+    """Write HTML content for a single page to an open text stream.
+    
+    nav_links holds a (page number, anchor HTML) pair per page of the report;
+    the current page is shown in bold instead of its anchor.
+    """
+    
+    # Detect key columns
+    artist_col, title_col = None, None
+    for col in config["artist_columns"]:
+        if col in df.columns:
+            artist_col = col
+            break
+    for col in config["title_columns"]:
+        if col in df.columns:
+            title_col = col
+            break
+    
+    out.write(_PAGE_HEAD_HTML % page_num)
+    out.write(f"""        <div class="stats">
+            <strong>Page {page_num} of {total_pages}</strong> • 
+            Showing {len(df)} items • 
+            Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         </div>
-"""
+""")
+
+    if total_pages > 1 and nav_links:
+        out.write("""
+        <div class="pagination">
+            Navigation: 
+""")
+        out.writelines(
+            f"<strong>{p}</strong> " if p == page_num else anchor
+            for p, anchor in nav_links
+        )
+        out.write("</div>")
+
+    out.write('<div class="album-grid">')
+    
+    # Pull plain column lists once rather than boxing every row into a Series
+    artists = _column_values(df, artist_col) if artist_col else ['Unknown Artist'] * len(df)
+    titles = _column_values(df, title_col) if title_col else ['Unknown Title'] * len(df)
+    keywords_list = _column_values(df, 'Keywords') if 'Keywords' in df.columns else [''] * len(df)
     
-    html += """
+    link_columns = [col for col in df.columns if col.endswith('_Link')]
+    # Everything after the URL is fixed per engine, so render it once per page
+    button_tails = [
+        _LINK_BUTTON_TAIL_HTML.format(engine=col.replace('_Link', '').translate(_HTML_ESCAPE))
+        for col in link_columns
+    ]
+    if link_columns:
+        link_rows = df[link_columns].itertuples(index=False, name=None)
+    else:
+        link_rows = [()] * len(df)
+    
+    out.writelines(_render_album_cards(artists, titles, keywords_list, link_rows, button_tails))
+    
+    out.write("""
         </div>
     </div>
 </body>
 </html>
-"""
-    
-    return html
+""")
 
 # ========================
 # Main Functions
@@ -469,6 +627,152 @@ def save_config(config: Dict, config_path: str = "config.json"):
     except Exception as e:
         print(f"Warning: Could not save config file: {e}")
 
+def read_collection_csv(input_path: str, encoding: str = 'utf-8', **read_kwargs) -> pd.DataFrame:
+    """Parse a whole collection CSV with the C engine through a 1 MiB read buffer."""
+    with open(input_path, 'rb', buffering=1 << 20) as f:
+        return pd.read_csv(f, encoding=encoding, low_memory=False, **read_kwargs)
+
+def iter_collection_csv(input_path: str, chunk_size: int, encoding: str = 'utf-8',
+                        **read_kwargs) -> Iterator[pd.DataFrame]:
+    """Chunked counterpart of read_collection_csv; keeps the file open while iterating."""
+    with open(input_path, 'rb', buffering=1 << 20) as f:
+        yield from pd.read_csv(f, encoding=encoding, chunksize=chunk_size, low_memory=False,
+                               **read_kwargs)
+
+def _with_encoding_fallback(read: Callable[[str], Any], logger: logging.Logger) -> Any:
+    """Run read(encoding) with UTF-8, retrying with latin-1 if decoding fails."""
+    try:
+        return read('utf-8')
+    except UnicodeDecodeError:
+        logger.info("UTF-8 failed, trying with latin-1 encoding...")
+        return read('latin-1')
+
+def load_collection(input_path: str, engine: str = "c",
+                    logger: logging.Logger = None) -> pd.DataFrame:
+    """Load a collection CSV with the requested parser engine."""
+    logger = logger or logging.getLogger("collection_processor")
+    
+    if engine == "pyarrow":
+        try:
+            df = pd.read_csv(input_path, engine='pyarrow', dtype_backend='pyarrow')
+            # Arrow reads text that is not valid UTF-8 as binary columns instead of failing
+            import pyarrow as pa
+            binary_columns = [
+                col for col, dtype in df.dtypes.items()
+                if isinstance(dtype, pd.ArrowDtype)
+                and (pa.types.is_binary(dtype.pyarrow_dtype)
+                     or pa.types.is_large_binary(dtype.pyarrow_dtype))
+            ]
+            if binary_columns:
+                raise ValueError(f"columns {binary_columns} are not valid UTF-8")
+            return df
+        except ImportError:
+            logger.warning("pyarrow is not installed, falling back to the C parser")
+        except Exception as e:
+            logger.warning(f"pyarrow parser failed ({e}), falling back to the C parser")
+    
+    return _with_encoding_fallback(lambda encoding: read_collection_csv(input_path, encoding), logger)
+
+def write_collection_csv(df: pd.DataFrame, out, engine: str = "c", header: bool = True):
+    """Write a processed collection as CSV to a path or binary stream.
+    
+    engine="pyarrow" uses Arrow's multi-threaded C++ writer when pyarrow is
+    installed and falls back to pandas' to_csv otherwise.
+    """
+    if engine == "pyarrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            pass
+        else:
+            pa_csv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                out,
+                write_options=pa_csv.WriteOptions(include_header=header, batch_size=16384)
+            )
+            return
+    
+    df.to_csv(out, index=False, header=header, encoding='utf-8')
+
+def process_collection_in_chunks(processor: CollectionProcessor, input_path: str, output_base: str,
+                                 chunk_size: int, artist_col: str = None, title_col: str = None,
+                                 search_engines: List[str] = None, write_csv: bool = True,
+                                 write_parquet: bool = False, write_html: bool = False,
+                                 items_per_page: int = 100, csv_engine: str = "c",
+                                 logger: logging.Logger = None):
+    """Stream a collection CSV through the processor one chunk at a time.
+    
+    Peak memory stays proportional to chunk_size instead of the file size.
+    Columns are read as text so every chunk has the same schema and values
+    are written back exactly as they appear in the input.
+    """
+    logger = logger or logging.getLogger("collection_processor")
+    
+    # Keep HTML pages aligned with chunk boundaries
+    chunk_size = -(-chunk_size // items_per_page) * items_per_page
+    
+    def write_chunks(encoding: str):
+        total_items = None
+        nav_links = None
+        if write_html:
+            # Page navigation needs the page count before the first page is written
+            total_items = sum(
+                len(chunk) for chunk in
+                iter_collection_csv(input_path, chunk_size, encoding, usecols=[0])
+            )
+            total_pages = (total_items + items_per_page - 1) // items_per_page
+            nav_links = build_nav_links(f"{output_base}.html", total_pages)
+        
+        csv_path = f"{output_base}.csv"
+        parquet_path = f"{output_base}.parquet"
+        csv_file = open(csv_path, 'wb') if write_csv else None
+        parquet_writer = None
+        pages_written = 0
+        records = 0
+        
+        try:
+            for chunk in iter_collection_csv(input_path, chunk_size, encoding, dtype=str):
+                processed = processor.process_dataframe(
+                    chunk, artist_col=artist_col, title_col=title_col, search_engines=search_engines
+                )
+                
+                if csv_file:
+                    write_collection_csv(processed, csv_file, csv_engine, header=(records == 0))
+                
+                if write_parquet:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    if parquet_writer is None:
+                        schema = pa.schema([(str(col), pa.string()) for col in processed.columns])
+                        parquet_writer = pq.ParquetWriter(parquet_path, schema, compression='zstd')
+                    parquet_writer.write_table(
+                        pa.Table.from_pandas(processed, schema=parquet_writer.schema,
+                                             preserve_index=False)
+                    )
+                
+                if write_html:
+                    generate_html_report(processed, f"{output_base}.html", items_per_page,
+                                         processor.config, logger,
+                                         page_offset=pages_written, total_items=total_items,
+                                         nav_links=nav_links)
+                    pages_written += (len(processed) + items_per_page - 1) // items_per_page
+                
+                records += len(processed)
+        finally:
+            if csv_file:
+                csv_file.close()
+            if parquet_writer is not None:
+                parquet_writer.close()
+        
+        logger.info(f"Processed {records} records in chunks of {chunk_size}")
+        if csv_file:
+            logger.info(f"CSV saved to: {csv_path}")
+        if parquet_writer is not None:
+            logger.info(f"Parquet saved to: {parquet_path}")
+    
+    _with_encoding_fallback(write_chunks, logger)
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -495,6 +799,12 @@ Examples:
                        help="Maximum number of keywords")
     parser.add_argument("--csv", action="store_true", help="Generate CSV output", default=True)
     parser.add_argument("--html", action="store_true", help="Generate HTML output")
+    parser.add_argument("--parquet", action="store_true",
+                       help="Also write Parquet output (requires pyarrow)")
+    parser.add_argument("--engine", choices=["c", "pyarrow"], default="c",
+                       help="CSV reader/writer engine; pyarrow is multi-threaded if installed")
+    parser.add_argument("--chunk-size", type=int, metavar="ROWS",
+                       help="Process the input in chunks of this many rows to limit memory use")
     parser.add_argument("--items-per-page", type=int, default=DEFAULT_CONFIG["html_items_per_page"],
                        help="Items per HTML page")
     parser.add_argument("--config", help="Configuration file path", default="config.json")
@@ -537,20 +847,42 @@ Examples:
             logger.error(f"Input file not found: {args.input}")
             sys.exit(1)
         
+        # Initialize processor
+        processor = CollectionProcessor(config, logger)
+        
+        # Determine output path
+        output_base = args.output or Path(args.input).stem + "_processed"
+        
+        if args.chunk_size:
+            logger.info(f"Streaming data from: {args.input}")
+            if args.engine == "pyarrow":
+                logger.warning("Chunked reading uses the C parser; pyarrow is only used for writing")
+            
+            process_collection_in_chunks(
+                processor,
+                args.input,
+                output_base,
+                args.chunk_size,
+                artist_col=args.artist,
+                title_col=args.title,
+                search_engines=args.search,
+                write_csv=args.csv or not args.html,
+                write_parquet=args.parquet,
+                write_html=args.html,
+                items_per_page=args.items_per_page,
+                csv_engine=args.engine,
+                logger=logger
+            )
+            logger.info("Processing complete!")
+            return
+        
         logger.info(f"Loading data from: {args.input}")
         
         # Load CSV with error handling
-        try:
-            df = pd.read_csv(args.input, encoding='utf-8')
-        except UnicodeDecodeError:
-            logger.info("UTF-8 failed, trying with latin-1 encoding...")
-            df = pd.read_csv(args.input, encoding='latin-1')
+        df = load_collection(args.input, args.engine, logger)
         
         logger.info(f"Loaded {len(df)} records with columns: {list(df.columns)}")
         
-        # Initialize processor
-        processor = CollectionProcessor(config, logger)
-        
         # Process the data
         processed_df = processor.process_dataframe(
             df, 
@@ -559,15 +891,17 @@ Examples:
             search_engines=args.search
         )
         
-        # Determine output path
-        output_base = args.output or Path(args.input).stem + "_processed"
-        
         # Generate outputs
         if args.csv or not args.html:
             csv_path = f"{output_base}.csv"
-            processed_df.to_csv(csv_path, index=False, encoding='utf-8')
+            write_collection_csv(processed_df, csv_path, args.engine)
             logger.info(f"CSV saved to: {csv_path}")
         
+        if args.parquet:
+            parquet_path = f"{output_base}.parquet"
+            processed_df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+            logger.info(f"Parquet saved to: {parquet_path}")
+        
         if args.html:
             html_path = f"{output_base}.html"
             generate_html_report(